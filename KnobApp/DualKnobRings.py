@@ -1,16 +1,27 @@
 import sys, math, os, ctypes
-from PyQt5.QtWidgets import QApplication, QWidget, QHBoxLayout, QShortcut
-from PyQt5.QtCore import Qt, QPointF, QRectF, QEvent, QSize, QTimer
+from PyQt5.QtWidgets import QApplication, QWidget, QHBoxLayout, QLabel, QShortcut
+from PyQt5.QtCore import (
+    Qt,
+    QPointF,
+    QRect,
+    QRectF,
+    QEvent,
+    QSize,
+    QTimer,
+    QElapsedTimer,
+)
 from PyQt5.QtGui import (
     QPainter,
+    QPixmapCache,
     QConicalGradient,
     QColor,
     QFont,
+    QFontMetrics,
     QPainterPath,
     QPixmap,
-    QPalette,
-    QBrush,
+    QImage,
     QPen,
+    QBrush,
     QIcon,
 )
 
@@ -20,6 +31,9 @@ CLOCKWISE_IS_UP = True
 MIN_COUNT = 0
 MAX_COUNT = 100
 KNOB_RADIUS = 250  # Active area radius in pixels
+KNOB_RADIUS_SQ = KNOB_RADIUS * KNOB_RADIUS  # hit test without sqrt
+MIN_DELTA_DEG = 0.2  # smaller angle changes are ignored as jitter
+RING_CACHE_LIMIT_KB = 20 * 1024  # QPixmapCache budget for ring states (ceiling)
 
 
 
@@ -33,16 +47,83 @@ def resource_path(relative_path: str) -> str:
 BACKGROUND_IMAGE = resource_path("FORTEC-Integrated_BG_4k.png")
 
 
-def normalize_deg(d):
+def angle_step(dx: float, dy: float, last):
+    """
+    Angle of the offset (dx, dy) from a knob center in degrees, plus its change
+    since `last` wrapped into -180..180 (0.0 when `last` is None).
+    """
+    a = math.degrees(math.atan2(dy, dx))
+    if last is None:
+        return a, 0.0
+    d = a - last
     if d > 180:
         d -= 360
     elif d < -180:
         d += 360
-    return d
+    return a, d
+
+
+def apply_ticks(value: int, accum: float, diff_deg: float):
+    """
+    Add a rotation of diff_deg to the tick accumulator. Returns the new
+    (value, accum), with value saturated to MIN_COUNT..MAX_COUNT.
+    """
+    if not CLOCKWISE_IS_UP:
+        diff_deg = -diff_deg
+    accum += diff_deg
+    # Whole ticks in one step; int() truncates toward zero so the
+    # remainder stays in (-DEGREES_PER_TICK, DEGREES_PER_TICK)
+    ticks = int(accum / DEGREES_PER_TICK)
+    accum -= ticks * DEGREES_PER_TICK
+    return max(MIN_COUNT, min(MAX_COUNT, value + ticks)), accum
+
 
+def replay_knob(points, center, value: int = 0, accum: float = 0.0):
+    """
+    Run a recorded sequence of (x, y) points through one knob offline, using
+    the same hit test, jitter threshold and tick accumulator as live input.
+    Returns the knob value after each point and the final accumulator.
 
-def dist(a: QPointF, b: QPointF) -> float:
-    return math.hypot(a.x() - b.x(), a.y() - b.y())
+    Unlike live input it sees only this knob: any point outside it resets the
+    tracking angle, whereas live input keeps it while the point is on the other
+    knob. It also skips the per-frame input throttle and handles every point.
+    """
+    cx, cy = center
+    last = None
+    values = []
+    for px, py in points:
+        dx, dy = px - cx, py - cy
+        if dx * dx + dy * dy <= KNOB_RADIUS_SQ:
+            angle, diff = angle_step(dx, dy, last)
+            if abs(diff) >= MIN_DELTA_DEG:
+                value, accum = apply_ticks(value, accum, diff)
+            last = angle
+        else:
+            last = None
+        values.append(value)
+    return values, accum
+
+
+def _color_for_value(v: int) -> QColor:
+    """Text color by value buckets (8 stops: green -> red)."""
+    if v == 0:
+        return QColor(0, 0, 0)
+    elif v <= 12:
+        return QColor(0, 200, 0)  # Green
+    elif v <= 25:
+        return QColor(80, 210, 0)  # Yellow-Green 1
+    elif v <= 37:
+        return QColor(150, 220, 0)  # Yellow-Green 2
+    elif v <= 50:
+        return QColor(220, 220, 0)  # Yellow
+    elif v <= 62:
+        return QColor(255, 200, 0)  # Amber
+    elif v <= 75:
+        return QColor(255, 165, 0)  # Orange
+    elif v <= 87:
+        return QColor(255, 100, 0)  # Orange-Red
+    else:
+        return QColor(220, 30, 10)  # Red
 
 
 class GradientRingWidget(QWidget):
@@ -51,9 +132,12 @@ class GradientRingWidget(QWidget):
     so the main window's background image shows through.
     """
 
+    _TEXT_COLORS = tuple(_color_for_value(v) for v in range(101))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._value = 0  # 0..100
+        self._dirty = False  # repaint request queued by setValue
         self.setMinimumSize(280, 280)
 
         # Transparent background so the window's image is visible behind this widget
@@ -69,6 +153,62 @@ class GradientRingWidget(QWidget):
         self.center_dx = 0.0
         self.center_dy = 0.0
 
+        # Paint resources that never change; only the gradient centers move
+        self._grad_main = QConicalGradient(0, 0, -90)  # top = -90°
+        self._grad_main.setColorAt(0.0, QColor(220, 30, 10))  # Red
+        self._grad_main.setColorAt(0.33, QColor(255, 165, 0))  # Orange
+        self._grad_main.setColorAt(0.66, QColor(255, 220, 0))  # Yellow
+        self._grad_main.setColorAt(1.0, QColor(0, 200, 0))  # Green
+
+        # 8-stop specular shine (white with fading alpha)
+        self._grad_shine = QConicalGradient(0, 0, -90)
+        self._grad_shine.setColorAt(0.00, QColor(255, 255, 255, 80))
+        self._grad_shine.setColorAt(0.08, QColor(255, 255, 255, 64))
+        self._grad_shine.setColorAt(0.16, QColor(255, 255, 255, 48))
+        self._grad_shine.setColorAt(0.24, QColor(255, 255, 255, 32))
+        self._grad_shine.setColorAt(0.32, QColor(255, 255, 255, 20))
+        self._grad_shine.setColorAt(0.40, QColor(255, 255, 255, 10))
+        self._grad_shine.setColorAt(0.70, QColor(255, 255, 255, 0))
+        self._grad_shine.setColorAt(1.00, QColor(255, 255, 255, 0))
+
+        self._pen_rim = QPen(
+            QColor(0, 0, 0, 100), 4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin
+        )
+        self._pen_inset = QPen(
+            QColor(255, 255, 255, 110), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin
+        )
+        self._brush_shadow = QBrush(QColor(0, 0, 0, 90))
+
+        # Arrow shaft width depends on the ring size; it is set per build
+        self._pen_arrow_shaft = QPen(
+            QColor(255, 255, 255, 220), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin
+        )
+        self._brush_arrow_head = QBrush(QColor(255, 255, 255, 230))
+
+        # Sector/shadow paths per value, valid for one ring geometry
+        self._sector_paths = {}
+        self._sector_key = None
+
+        # Offscreen render target covering only the ring's bounding rect;
+        # premultiplied ARGB is the raster fast path
+        self._buf = QImage()
+
+        # Bold value font and its metrics per point size
+        self._font_cache = {}
+        self._fm_cache = {}
+
+        # Arrow pre-rendered once per ring size, then rotated into place
+        self._arrow_pix = None
+        self._arrow_origin = None
+        self._arrow_key = None
+
+        # Rendered ring states live in the global QPixmapCache (one per value/size).
+        # The budget is fixed at RING_CACHE_LIMIT_KB rather than scaled to hold all
+        # 101 states: that is ~22 ring-rect states at 1080p and ~5 at 4K, and LRU
+        # keeps the values around the current one, which is where a drag moves.
+        if QPixmapCache.cacheLimit() < RING_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(RING_CACHE_LIMIT_KB)
+
     def set_center_offset(self, dx: float, dy: float):
         """Shift the ring's drawing center by (dx, dy) pixels inside this widget."""
         self.center_dx = float(dx)
@@ -100,200 +240,183 @@ class GradientRingWidget(QWidget):
         v = max(0, min(100, int(v)))
         if v != self._value:
             self._value = v
-            self.update()
+            # Merge value changes within one event-loop pass into one repaint
+            if not self._dirty:
+                self._dirty = True
+                QTimer.singleShot(0, self._flush)
+
+    def _flush(self):
+        self._dirty = False
+        # Only the ring area changes with the value
+        self.update(self._ring_bounding_rect())
 
     def value(self) -> int:
         return self._value
 
-    def paintEvent(self, _):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        w, h = self.width(), self.height()
-
+    def _base_center(self, w: int, h: int):
         # Choose center: fixed if set, else live center
         if (
             self._use_fixed_center
             and self._fixed_cx is not None
             and self._fixed_cy is not None
         ):
-            cx, cy = self._fixed_cx, self._fixed_cy
-        else:
-            cx, cy = w / 2.0, h / 2.0
+            return self._fixed_cx, self._fixed_cy
+        return w / 2.0, h / 2.0
 
+    def _center(self, w: int, h: int):
+        cx, cy = self._base_center(w, h)
         # Apply per-widget center offset (so donut + text move together)
-        cx += self.center_dx
-        cy += self.center_dy
+        return cx + self.center_dx, cy + self.center_dy
+
+    @staticmethod
+    def _ring_rect(cx: float, cy: float, w: int, h: int) -> QRect:
+        """Rect around (cx, cy) covering the ring, its rim and drop shadow."""
+        R_outer = min(w, h) * 0.25
+        margin = R_outer + 8  # rim stroke + shadow offset
+        rect = QRectF(cx - margin, cy - margin, 2 * margin, 2 * margin)
+        return rect.toAlignedRect()
+
+    def _ring_bounding_rect(self) -> QRect:
+        """Widget-space rect covering the ring, its rim and drop shadow."""
+        w, h = self.width(), self.height()
+        cx, cy = self._center(w, h)
+        return self._ring_rect(cx, cy, w, h)
+
+    def _ring_pixmap(self, v: int, w: int, h: int):
+        """
+        Return the rendered ring for value v and the widget-space top-left of
+        its rect (before the center offset), rendering it on cache miss. Only
+        the ring's bounding rect is rendered and cached. The center offset is
+        applied when blitting, so rings of the same size share entries.
+        """
+        cx, cy = self._base_center(w, h)
+        rect = self._ring_rect(cx, cy, w, h)
+        # Size and center are part of the key, so geometry changes never go stale
+        key = f"ringv{v}-{w}x{h}-{cx:g},{cy:g}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            if self._buf.size() != rect.size():
+                self._buf = QImage(rect.size(), QImage.Format_ARGB32_Premultiplied)
+            self._buf.fill(0)
+            buf_painter = QPainter(self._buf)
+            # Draw in widget coordinates; the buffer starts at the rect's corner
+            buf_painter.translate(-rect.x(), -rect.y())
+            self._render_ring(buf_painter, v, w, h, cx, cy)
+            buf_painter.end()
+            pixmap = QPixmap.fromImage(self._buf)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap, rect.topLeft()
+
+    def paintEvent(self, ev):
+        w, h = self.width(), self.height()
+        pixmap, origin = self._ring_pixmap(self._value, w, h)
+        painter = QPainter(self)
+        # Blit only the exposed part of the cached ring, shifted by the offset
+        painter.setClipRegion(ev.region())
+        painter.drawPixmap(
+            QPointF(origin.x() + self.center_dx, origin.y() + self.center_dy),
+            pixmap,
+        )
+
+    def _render_ring(
+        self, painter: QPainter, v: int, w: int, h: int, cx: float, cy: float
+    ):
+        painter.setRenderHint(QPainter.Antialiasing)
 
         # Ring size
         R_outer = min(w, h) * 0.25
         R_inner = R_outer * 0.50  # keep it a donut (not a pie)
 
-        # Geometry rects
+        # Geometry rect
         rect_outer = QRectF(cx - R_outer, cy - R_outer, 2 * R_outer, 2 * R_outer)
-        rect_inner = QRectF(cx - R_inner, cy - R_inner, 2 * R_inner, 2 * R_inner)
-
-        # Conical gradient (top = -90°)
-        gradient = QConicalGradient(QPointF(cx, cy), -90)
-        c0 = QColor(220, 30, 10)  # Red
-        c1 = QColor(255, 165, 0)  # Orange
-        c2 = QColor(255, 220, 0)  # Yellow
-        c3 = QColor(0, 200, 0)  # Green
-        gradient.setColorAt(0.0, c0)
-        gradient.setColorAt(0.33, c1)
-        gradient.setColorAt(0.66, c2)
-        gradient.setColorAt(1.0, c3)
+
+        # Conical gradient centered on the ring
+        self._grad_main.setCenter(cx, cy)
 
         # Visible donut sector (CLOCKWISE)
-        visible_angle = 360.0 * (self._value / 100.0)
+        visible_angle = 360.0 * (v / 100.0)
         start_deg = -90.0  # top (12 o'clock)
 
-        sector = QPainterPath()
-        sector.moveTo(QPointF(cx, cy))
-        sector.arcMoveTo(rect_outer, start_deg)
-        sector.arcTo(rect_outer, start_deg, -visible_angle)  # negative = clockwise
-        end_deg = start_deg - visible_angle
-        # Close back using inner arc
-        sector.lineTo(self._point_on_circle(cx, cy, 0, end_deg))
-        sector.arcTo(rect_inner, end_deg, +visible_angle)  # CCW inner arc back to start
-        sector.closeSubpath()
+        sector, shadow = self._sector_paths_for(v, cx, cy, R_outer, R_inner)
 
         # -------- 3D ENHANCEMENTS (visual only) --------
 
-        # 1) Soft drop shadow behind the sector
-        if visible_angle > 0.5:
-            shadow = QPainterPath(sector)
-            shadow.translate(4, 6)  # subtle offset
+        # 1) Soft drop shadow behind the sector. Drawn without AA, so its visible
+        #    lower-right edge (offset 4, 6) is deliberately aliased.
+        #    Too thin to notice below a few degrees, so skip it there.
+        if visible_angle > 5.0:
+            painter.setRenderHint(QPainter.Antialiasing, False)
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(0, 0, 0, 90))
+            painter.setBrush(self._brush_shadow)
             painter.drawPath(shadow)
+            painter.setRenderHint(QPainter.Antialiasing, True)
 
         # 2) Base fill with your conical gradient
         painter.setPen(Qt.NoPen)
-        painter.setBrush(gradient)
+        painter.setBrush(self._grad_main)
         painter.drawPath(sector)
 
         # 3) Beveled outer rim (dark stroke + slight inner highlight)
         painter.setBrush(Qt.NoBrush)
         # dark outer rim
-        painter.setPen(
-            QPen(QColor(0, 0, 0, 100), 4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-        )
+        painter.setPen(self._pen_rim)
         painter.drawArc(rect_outer, int(start_deg * 16), int(-visible_angle * 16))
         # inner highlight (slightly inset)
         inset = 4
         rect_inset = QRectF(rect_outer.adjusted(inset, inset, -inset, -inset))
-        painter.setPen(
-            QPen(QColor(255, 255, 255, 110), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-        )
+        painter.setPen(self._pen_inset)
         painter.drawArc(rect_inset, int(start_deg * 16), int(-visible_angle * 16))
 
-        # 4) Specular shine clipped to the sector
-        painter.save()
-        painter.setClipPath(sector)
+        # 4) Specular shine clipped to the sector (invisible on short sectors).
+        #    The clip shapes it, so only the sector's bounding box is filled.
+        if visible_angle > 20.0:
+            painter.save()
+            painter.setClipPath(sector)
+            self._grad_shine.setCenter(cx, cy)
 
-        # 8-stop specular shine (white with fading alpha)
-        shine = QConicalGradient(QPointF(cx, cy), -90)
-        shine.setColorAt(0.00, QColor(255, 255, 255, 80))
-        shine.setColorAt(0.08, QColor(255, 255, 255, 64))
-        shine.setColorAt(0.16, QColor(255, 255, 255, 48))
-        shine.setColorAt(0.24, QColor(255, 255, 255, 32))
-        shine.setColorAt(0.32, QColor(255, 255, 255, 20))
-        shine.setColorAt(0.40, QColor(255, 255, 255, 10))
-        shine.setColorAt(0.70, QColor(255, 255, 255, 0))
-        shine.setColorAt(1.00, QColor(255, 255, 255, 0))
-
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(shine)
-        painter.drawEllipse(rect_outer)
-        painter.restore()
+            # The sector clip already shapes the edges, so skip AA on the fill
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._grad_shine)
+            painter.drawRect(sector.boundingRect())
+            painter.restore()
 
         # ---- White arrow: fixed size, hidden inside inner radius, invisible at 0 ----
-        if self._value > 0:
+        if v > 0:
+            if self._arrow_key != (R_outer, R_inner):
+                self._arrow_pix, self._arrow_origin = self._build_arrow_pixmap(
+                    R_outer, R_inner
+                )
+                self._arrow_key = (R_outer, R_inner)
+
             # Angle: start at south (90°) and rotate CLOCKWISE with visible_angle
             theta_deg = start_deg + 180.0 + visible_angle
-            theta = math.radians(theta_deg)
-            dirx, diry = math.cos(theta), math.sin(theta)
-
-            # Fixed size (relative to R_outer)
-            L_max_frac = 1.0  # total arrow length (center -> tip)
-            head_len_frac = 0.12  # head length
-            head_base_frac = 0.06  # half base width of head
-            shaft_width_frac = 0.04  # shaft stroke width
-
-            L = R_outer * L_max_frac
-            head_len = R_outer * head_len_frac
-            half_base = R_outer * head_base_frac
-            shaft_w = max(2.0, R_outer * shaft_width_frac)
-
-            # Start just outside the inner radius (hide inside hole)
-            inner_gap = max(2.0, R_outer * 0.02)
-            r_start = R_inner + inner_gap
-
-            base_len = max(r_start, L - head_len)
-
-            # Points
-            sx, sy = cx + r_start * dirx, cy + r_start * diry
-            bx, by = cx + base_len * dirx, cy + base_len * diry
-            tx, ty = cx + L * dirx, cy + L * diry
-
-            # Perpendicular for head base
-            perpx, perpy = -diry, dirx
-            lx, ly = bx + perpx * half_base, by + perpy * half_base
-            rx, ry = bx - perpx * half_base, by - perpy * half_base
-
-            # Draw shaft
-            painter.setPen(
-                QPen(
-                    QColor(255, 255, 255, 220),
-                    shaft_w,
-                    Qt.SolidLine,
-                    Qt.RoundCap,
-                    Qt.RoundJoin,
-                )
-            )
-            painter.setBrush(Qt.NoBrush)
-            painter.drawLine(QPointF(sx, sy), QPointF(bx, by))
 
-            # Draw head (filled triangle)
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(255, 255, 255, 230))
-            head = QPainterPath()
-            head.moveTo(QPointF(tx, ty))
-            head.lineTo(QPointF(lx, ly))
-            head.lineTo(QPointF(rx, ry))
-            head.closeSubpath()
-            painter.drawPath(head)
-
-        # ===== TEXT COLOR BY VALUE BUCKETS (8 stops: green -> red) =====
-        v = self._value
-        if v == 0:
-            text_color = QColor(0, 0, 0)
-        elif v <= 12:
-            text_color = QColor(0, 200, 0)  # Green
-        elif v <= 25:
-            text_color = QColor(80, 210, 0)  # Yellow-Green 1
-        elif v <= 37:
-            text_color = QColor(150, 220, 0)  # Yellow-Green 2
-        elif v <= 50:
-            text_color = QColor(220, 220, 0)  # Yellow
-        elif v <= 62:
-            text_color = QColor(255, 200, 0)  # Amber
-        elif v <= 75:
-            text_color = QColor(255, 165, 0)  # Orange
-        elif v <= 87:
-            text_color = QColor(255, 100, 0)  # Orange-Red
-        else:
-            text_color = QColor(220, 30, 10)  # Red
+            painter.save()
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+            painter.translate(cx, cy)
+            painter.rotate(theta_deg)
+            painter.drawPixmap(self._arrow_origin, self._arrow_pix)
+            painter.restore()
 
-        # Value text
+        # ===== TEXT COLOR BY VALUE BUCKETS (precomputed per value) =====
+        text_color = self._TEXT_COLORS[v]
+
+        # Value text (glyphs use text AA only)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setRenderHint(QPainter.TextAntialiasing, True)
         painter.setPen(text_color)
-        font = QFont()
-        font.setPointSize(int(min(w, h) * 0.015))
-        font.setBold(True)
+        k = int(min(w, h) * 0.015)
+        font = self._font_cache.get(k)
+        if font is None:
+            font = QFont()
+            font.setPointSize(k)
+            font.setBold(True)
+            self._font_cache[k] = font
+            # Metrics for the offscreen buffer, not the painter's synced state
+            self._fm_cache[k] = QFontMetrics(font, self._buf)
+        fm = self._fm_cache[k]
         painter.setFont(font)
-        text = f"{self._value}"
-        fm = painter.fontMetrics()
         # painter.drawText(
         #     QRectF(
         #         cx - R_inner, cy - 0.6 * fm.height(), 2 * R_inner, 0.9 * fm.height()
@@ -302,8 +425,7 @@ class GradientRingWidget(QWidget):
         #     text,
         # )
         # ----- Math-based centered number drawing -----
-        text = str(self._value)
-        fm = painter.fontMetrics()
+        text = str(v)
 
         text_width = fm.horizontalAdvance(text)
         text_height = fm.height()
@@ -324,6 +446,90 @@ class GradientRingWidget(QWidget):
         # painter.drawEllipse(QPointF(cx, cy), KNOB_RADIUS, KNOB_RADIUS)
         # # ==============================================================
 
+    def _build_arrow_pixmap(self, R_outer, R_inner):
+        """
+        Render the arrow pointing along +x from the ring center. Returns the
+        pixmap and where its top-left corner sits in that center-based frame.
+        """
+        # Fixed size (relative to R_outer)
+        L_max_frac = 1.0  # total arrow length (center -> tip)
+        head_len_frac = 0.12  # head length
+        head_base_frac = 0.06  # half base width of head
+        shaft_width_frac = 0.04  # shaft stroke width
+
+        L = R_outer * L_max_frac
+        head_len = R_outer * head_len_frac
+        half_base = R_outer * head_base_frac
+        shaft_w = max(2.0, R_outer * shaft_width_frac)
+
+        # Start just outside the inner radius (hide inside hole)
+        inner_gap = max(2.0, R_outer * 0.02)
+        r_start = R_inner + inner_gap
+
+        base_len = max(r_start, L - head_len)
+
+        # Local bounds: round cap behind the shaft start up to the tip, plus AA
+        pad = 2.0
+        x0 = r_start - shaft_w / 2 - pad
+        half_h = max(half_base, shaft_w / 2) + pad
+        pix = QPixmap(math.ceil(L + pad - x0), math.ceil(2 * half_h))
+        pix.fill(Qt.transparent)
+
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.translate(-x0, half_h)
+
+        # Draw shaft
+        self._pen_arrow_shaft.setWidthF(shaft_w)
+        p.setPen(self._pen_arrow_shaft)
+        p.setBrush(Qt.NoBrush)
+        p.drawLine(QPointF(r_start, 0), QPointF(base_len, 0))
+
+        # Draw head (filled triangle)
+        p.setPen(Qt.NoPen)
+        p.setBrush(self._brush_arrow_head)
+        head = QPainterPath()
+        head.moveTo(QPointF(L, 0))
+        head.lineTo(QPointF(base_len, half_base))
+        head.lineTo(QPointF(base_len, -half_base))
+        head.closeSubpath()
+        p.drawPath(head)
+        p.end()
+
+        return pix, QPointF(x0, -half_h)
+
+    def _sector_paths_for(self, v, cx, cy, R_outer, R_inner):
+        """Return (sector, shadow) paths for value v, building them once."""
+        key = (cx, cy, R_outer, R_inner)
+        if key != self._sector_key:
+            self._sector_paths.clear()
+            self._sector_key = key
+
+        paths = self._sector_paths.get(v)
+        if paths is None:
+            rect_outer = QRectF(cx - R_outer, cy - R_outer, 2 * R_outer, 2 * R_outer)
+            rect_inner = QRectF(cx - R_inner, cy - R_inner, 2 * R_inner, 2 * R_inner)
+            visible_angle = 360.0 * (v / 100.0)
+            start_deg = -90.0  # top (12 o'clock)
+
+            # Visible donut sector (CLOCKWISE)
+            sector = QPainterPath()
+            sector.moveTo(QPointF(cx, cy))
+            sector.arcMoveTo(rect_outer, start_deg)
+            sector.arcTo(rect_outer, start_deg, -visible_angle)  # negative = clockwise
+            end_deg = start_deg - visible_angle
+            # Close back using inner arc
+            sector.lineTo(self._point_on_circle(cx, cy, 0, end_deg))
+            sector.arcTo(rect_inner, end_deg, +visible_angle)  # CCW inner arc back
+            sector.closeSubpath()
+
+            shadow = QPainterPath(sector)
+            shadow.translate(4, 6)  # subtle offset
+
+            paths = (sector, shadow)
+            self._sector_paths[v] = paths
+        return paths
+
     @staticmethod
     def _point_on_circle(cx, cy, r, deg):
         rad = math.radians(deg)
@@ -333,7 +539,7 @@ class GradientRingWidget(QWidget):
 class DualKnobRings(QWidget):
     """
     Two interactive knob zones (left/right). Each knob controls a ring (0..100).
-    Background image is applied to THIS widget via palette (like your reference code).
+    Background image is shown by a QLabel child kept beneath the ring widgets.
     """
 
     def __init__(self):
@@ -345,28 +551,28 @@ class DualKnobRings(QWidget):
         self._esc = QShortcut(Qt.Key_Escape, self)
         self._esc.activated.connect(QApplication.quit)
 
-        # --- Load and set background (reference-style) ---
+        # --- Load and set background (label behind everything else) ---
         self._bg_pixmap = QPixmap(BACKGROUND_IMAGE.replace("\\", "/"))
-        if not self._bg_pixmap.isNull():
-            pal = self.palette()
-            pal.setBrush(
-                QPalette.Window,
-                QBrush(
-                    self._bg_pixmap.scaled(
-                        self.size(),
-                        Qt.KeepAspectRatioByExpanding,
-                        Qt.SmoothTransformation,
-                    )
-                ),
-            )
-            self.setPalette(pal)
-            self.setAutoFillBackground(True)
-        else:
+        self._bg_label = QLabel(self)
+        self._bg_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self._bg_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self._bg_label.lower()
+        # Scaled copy of the background and the size it was scaled for
+        self._scaled_bg = None
+        self._scaled_bg_size = None
+        # Smooth rescale runs once resizing has settled
+        self._bg_polish_timer = QTimer(self)
+        self._bg_polish_timer.setSingleShot(True)
+        self._bg_polish_timer.setInterval(150)
+        self._bg_polish_timer.timeout.connect(self._polish_bg)
+        # Scaling waits for the first resizeEvent, when the real size is known
+        if self._bg_pixmap.isNull():
             print(f"Could not load image: {BACKGROUND_IMAGE}")
 
         # Centers & counters
-        self.center_left = QPointF(0, 0)
-        self.center_right = QPointF(0, 0)
+        # Knob centers are plain (x, y) float tuples: cheap to read per event
+        self.center_left = (0.0, 0.0)
+        self.center_right = (0.0, 0.0)
         self.last_angle_left = None
         self.last_angle_right = None
         self.accum_left = 0.0
@@ -374,6 +580,17 @@ class DualKnobRings(QWidget):
         self.value_left = 0
         self.value_right = 0
 
+        # Input throttling: handle at most one point per display frame.
+        # Points arriving sooner are held back and flushed by a timer, so
+        # the last position of a gesture is never lost.
+        self._min_frame_ms = 8
+        self._et = QElapsedTimer()
+        self._et.start()
+        self._pending_point = None
+        self._pending_timer = QTimer(self)
+        self._pending_timer.setSingleShot(True)
+        self._pending_timer.timeout.connect(self._flush_pending_point)
+
         # Layout with two transparent ring widgets on top of the background
         layout = QHBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -383,10 +600,36 @@ class DualKnobRings(QWidget):
         self.ring_right = GradientRingWidget()
         layout.addWidget(self.ring_left, 1)
         layout.addWidget(self.ring_right, 1)
+        self.ring_left.raise_()
+        self.ring_right.raise_()
 
         # Lock each ring's center after first layout (optional)
         QTimer.singleShot(0, self._lock_centers_once)
 
+    def _update_background(self):
+        """Rescale the background to the window size, skipping repeated sizes."""
+        sz = self.size()
+        if sz == self._scaled_bg_size:
+            return
+        # Cheap scale while resizing; the smooth one follows in _polish_bg
+        self._scaled_bg = self._bg_pixmap.scaled(
+            sz,
+            Qt.KeepAspectRatioByExpanding,
+            Qt.FastTransformation,
+        )
+        self._scaled_bg_size = sz
+        self._bg_label.setPixmap(self._scaled_bg)
+        self._bg_polish_timer.start()  # restarts if already pending
+
+    def _polish_bg(self):
+        self._scaled_bg = self._bg_pixmap.scaled(
+            self.size(),
+            Qt.KeepAspectRatioByExpanding,
+            Qt.SmoothTransformation,
+        )
+        self._scaled_bg_size = self.size()
+        self._bg_label.setPixmap(self._scaled_bg)
+
     def _lock_centers_once(self):
         self.ring_left.lock_center_to_current()
         self.ring_right.lock_center_to_current()
@@ -395,20 +638,10 @@ class DualKnobRings(QWidget):
         GLOBAL_OFFSET_X = -250    # pixels
         GLOBAL_OFFSET_Y = 0    # pixels
 
-        # Rescale background image when window size changes (reference-style)
+        # Rescale background image when window size changes
+        self._bg_label.setGeometry(0, 0, self.width(), self.height())
         if not self._bg_pixmap.isNull():
-            pal = self.palette()
-            pal.setBrush(
-                QPalette.Window,
-                QBrush(
-                    self._bg_pixmap.scaled(
-                        self.size(),
-                        Qt.KeepAspectRatioByExpanding,
-                        Qt.SmoothTransformation,
-                    )
-                ),
-            )
-            self.setPalette(pal)
+            self._update_background()
 
         # Update live centers for interaction (if you use them)
         w, h = self.width(), self.height()
@@ -416,8 +649,8 @@ class DualKnobRings(QWidget):
         shift_px = (3.0 / 2.54) * dpi_x  # 2 cm -> pixels
 
         # Move the knob interaction zones
-        self.center_left = QPointF(w * 0.25 + GLOBAL_OFFSET_X, h * 0.50 + GLOBAL_OFFSET_Y)  # left knob 2 cm left
-        self.center_right = QPointF(
+        self.center_left = (w * 0.25 + GLOBAL_OFFSET_X, h * 0.50 + GLOBAL_OFFSET_Y)  # left knob 2 cm left
+        self.center_right = (
             w * 0.75 - GLOBAL_OFFSET_X, h * 0.50 + GLOBAL_OFFSET_Y
         )  # right knob 2 cm right
 
@@ -427,63 +660,65 @@ class DualKnobRings(QWidget):
 
         super().resizeEvent(e)
 
-    def angle_from(self, p: QPointF, c: QPointF) -> float:
-        return math.degrees(math.atan2(p.y() - c.y(), p.x() - c.x()))
-
     def _apply_delta(self, is_left: bool, diff_deg: float):
-        sign = 1 if CLOCKWISE_IS_UP else -1
-        diff_deg *= sign
-
         if is_left:
-            self.accum_left += diff_deg
-            while self.accum_left >= DEGREES_PER_TICK:
-                if self.value_left < MAX_COUNT:
-                    self.value_left += 1
-                self.accum_left -= DEGREES_PER_TICK
-            while self.accum_left <= -DEGREES_PER_TICK:
-                if self.value_left > MIN_COUNT:
-                    self.value_left -= 1
-                self.accum_left += DEGREES_PER_TICK
+            self.value_left, self.accum_left = apply_ticks(
+                self.value_left, self.accum_left, diff_deg
+            )
             self.ring_left.setValue(self.value_left)
         else:
-            self.accum_right += diff_deg
-            while self.accum_right >= DEGREES_PER_TICK:
-                if self.value_right < MAX_COUNT:
-                    self.value_right += 1
-                self.accum_right -= DEGREES_PER_TICK
-            while self.accum_right <= -DEGREES_PER_TICK:
-                if self.value_right > MIN_COUNT:
-                    self.value_right -= 1
-                self.accum_right += DEGREES_PER_TICK
+            self.value_right, self.accum_right = apply_ticks(
+                self.value_right, self.accum_right, diff_deg
+            )
             self.ring_right.setValue(self.value_right)
 
     def event(self, ev):
         if ev.type() in (QEvent.TouchBegin, QEvent.TouchUpdate, QEvent.TouchEnd):
             pts = ev.touchPoints()
             if pts:
-                self._process_point(pts[0].pos())
+                tp = pts[0].pos()
+                self._process_point_xy(tp.x(), tp.y())
             ev.accept()
             return True
         return super().event(ev)
 
     def mouseMoveEvent(self, ev):
-        self._process_point(ev.pos())
-
-    def _process_point(self, p: QPointF):
-        if dist(p, self.center_left) <= KNOB_RADIUS:
-            angle = self.angle_from(p, self.center_left)
-            if self.last_angle_left is not None:
-                diff = normalize_deg(angle - self.last_angle_left)
-                if abs(diff) >= 0.2:
-                    self._apply_delta(True, diff)
+        pos = ev.pos()
+        self._process_point_xy(pos.x(), pos.y())
+
+    def _flush_pending_point(self):
+        p, self._pending_point = self._pending_point, None
+        if p is not None:
+            self._process_point_xy(*p)
+
+    def _process_point_xy(self, px: float, py: float):
+        elapsed = self._et.elapsed()
+        if elapsed < self._min_frame_ms:
+            # Too soon after the last one: keep only the newest point
+            self._pending_point = (px, py)
+            if not self._pending_timer.isActive():
+                self._pending_timer.start(self._min_frame_ms - elapsed)
+            return
+        self._et.restart()
+        self._pending_point = None
+        self._pending_timer.stop()
+
+        # Squared-distance hit tests; dx/dy are reused for the angle
+        cx, cy = self.center_left
+        dx, dy = px - cx, py - cy
+        if dx * dx + dy * dy <= KNOB_RADIUS_SQ:
+            angle, diff = angle_step(dx, dy, self.last_angle_left)
+            if abs(diff) >= MIN_DELTA_DEG:
+                self._apply_delta(True, diff)
             self.last_angle_left = angle
-
-        elif dist(p, self.center_right) <= KNOB_RADIUS:
-            angle = self.angle_from(p, self.center_right)
-            if self.last_angle_right is not None:
-                diff = normalize_deg(angle - self.last_angle_right)
-                if abs(diff) >= 0.2:
-                    self._apply_delta(False, diff)
+            return
+
+        cx, cy = self.center_right
+        dx, dy = px - cx, py - cy
+        if dx * dx + dy * dy <= KNOB_RADIUS_SQ:
+            angle, diff = angle_step(dx, dy, self.last_angle_right)
+            if abs(diff) >= MIN_DELTA_DEG:
+                self._apply_delta(False, diff)
             self.last_angle_right = angle
         else:
             self.last_angle_left = None
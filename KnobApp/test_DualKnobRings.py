@@ -0,0 +1,65 @@
+import math
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtWidgets import QApplication
+
+import DualKnobRings as knobs
+
+
+@pytest.fixture(scope="module")
+def window():
+    app = QApplication.instance() or QApplication([])
+    w = knobs.DualKnobRings()
+    w.resize(1600, 900)
+    w.show()
+    app.processEvents()
+    w._min_frame_ms = 0  # process every point, like replay_knob
+    yield w
+    w.close()
+
+
+def recorded_points(center):
+    """A session on one knob: turns both ways, jitter, a flick, a pass outside."""
+    cx, cy = center
+    angles = [i * 7.0 for i in range(120)]  # several turns clockwise
+    angles += [angles[-1] - i * 3.0 for i in range(1, 200)]  # back the other way
+    angles += [angles[-1] + (0.1 if i % 2 else -0.1) for i in range(20)]  # jitter
+    angles += [angles[-1] + i * 150.0 for i in range(1, 6)]  # fast flick
+    points = [
+        (cx + 120 * math.cos(math.radians(a)), cy + 120 * math.sin(math.radians(a)))
+        for a in angles
+    ]
+    # Leave the knob (between the two zones) and come back
+    points.append((800.0, 100.0))
+    points += [
+        (cx + 90 * math.cos(math.radians(a)), cy + 90 * math.sin(math.radians(a)))
+        for a in range(0, 300, 11)
+    ]
+    return points
+
+
+@pytest.mark.parametrize("is_left", [True, False])
+def test_replay_matches_live_input(window, is_left):
+    side = "left" if is_left else "right"
+    center = getattr(window, f"center_{side}")
+    points = recorded_points(center)
+
+    window.value_left = window.value_right = 0
+    window.accum_left = window.accum_right = 0.0
+    window.last_angle_left = window.last_angle_right = None
+
+    live = []
+    for px, py in points:
+        window._process_point_xy(px, py)
+        live.append(getattr(window, f"value_{side}"))
+
+    values, accum = knobs.replay_knob(points, center)
+
+    assert values == live
+    assert accum == pytest.approx(getattr(window, f"accum_{side}"))
+    assert 0 < max(values)  # the session actually moved the knob